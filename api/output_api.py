@@ -8,6 +8,7 @@ from flask import Flask, jsonify, request
 from flask_cors import CORS
 import sys
 import os
+import hashlib
 from datetime import datetime, timedelta
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -27,6 +28,34 @@ cache = CacheManager()
 if cache.redis_client:
     cache.connect()
 
+# Largest page /api/articles/recent will return in one response
+MAX_RECENT_LIMIT = 500
+
+# Seconds clients may reuse /api/health and /api/stream/latest responses
+CONDITIONAL_MAX_AGE = 5
+
+
+def conditional_jsonify(payload, etag_data):
+    """
+    Build a JSON response with an ETag, or an empty 304 if the client has it.
+    
+    Args:
+        payload (dict): Response body
+        etag_data: The parts of the body that matter for freshness
+            (timestamps like stream_time are left out so re-runs can match)
+    
+    Returns:
+        Response: 200 with the body, or 304 Not Modified
+    """
+    response = jsonify(payload)
+    # Weak ETag: responses that differ only in left-out timestamps share it,
+    # so it must not claim the bodies are byte-identical
+    response.set_etag(hashlib.blake2b(repr(etag_data).encode('utf-8'), digest_size=8).hexdigest(), weak=True)
+    response.cache_control.max_age = CONDITIONAL_MAX_AGE
+    
+    # Turns the response into a bodyless 304 when If-None-Match matches
+    return response.make_conditional(request)
+
 
 @app.route('/')
 def home():
@@ -62,12 +91,14 @@ def health_check():
     except:
         cache_status = "disconnected"
     
-    return jsonify({
-        'status': 'healthy' if db_status == 'connected' else 'degraded',
+    status = 'healthy' if db_status == 'connected' else 'degraded'
+    
+    return conditional_jsonify({
+        'status': status,
         'database': db_status,
         'cache': cache_status,
         'published_at': datetime.now().isoformat()
-    })
+    }, etag_data=(status, db_status, cache_status))
 
 
 @app.route('/api/articles', methods=['GET'])
@@ -207,22 +238,23 @@ def get_recent_articles():
     
     Query params:
         hours (int): Hours to look back (default: 24)
-        limit (int): Max articles (default: 100)
+        limit (int): Max articles (default: 100, at most MAX_RECENT_LIMIT)
     """
     try:
         hours = request.args.get('hours', 24, type=int)
         limit = request.args.get('limit', 100, type=int)
+        limit = max(0, min(limit, MAX_RECENT_LIMIT))
         
         # Calculate time range
         to_date = datetime.now()
         from_date = to_date - timedelta(hours=hours)
         
-        # Get articles
-        articles = db.get_articles_by_date_range(from_date, to_date)
+        # Get articles (only as many as we return)
+        articles = db.get_articles_by_date_range(from_date, to_date, limit=limit)
         
         # Convert to list of dicts
         result = []
-        for article in articles[:limit]:
+        for article in articles:
             result.append({
                 'article_id': article['article_id'],
                 'title': article['title'],
@@ -331,12 +363,12 @@ def stream_latest():
                 'sentiment_score': article['sentiment_score']
             })
         
-        return jsonify({
+        return conditional_jsonify({
             'success': True,
             'stream_time': datetime.now().isoformat(),
             'count': len(result),
             'articles': result
-        })
+        }, etag_data=result)
     
     except Exception as e:
         return jsonify({
@@ -352,11 +384,19 @@ def export_json():
     
     Query params:
         ticker (str): Optional ticker filter
+        tickers (str): Optional comma-separated tickers (one query for all)
+        limit (int): Max articles per ticker when using tickers (default: 100)
     """
     try:
         ticker = request.args.get('ticker')
+        tickers = request.args.get('tickers')
         
-        if ticker:
+        if tickers:
+            ticker_list = [t.strip().upper() for t in tickers.split(',') if t.strip()]
+            limit = request.args.get('limit', 100, type=int)
+            articles = db.get_articles_by_tickers(ticker_list, limit=limit)
+            ticker = ','.join(ticker_list)
+        elif ticker:
             articles = db.get_articles_by_ticker(ticker.upper(), limit=1000)
         else:
             articles = db.get_latest_articles(n=1000)
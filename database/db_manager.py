@@ -62,6 +62,20 @@ class DatabaseManager:
     
     # ========== ARTICLE OPERATIONS ==========
     
+    @staticmethod
+    def _get_raw_text(article):
+        """
+        Get the raw text to store for an article.
+        
+        Scraped articles don't carry a raw_text copy of their body, so it is
+        built from title, description and body only when saving.
+        """
+        if article.get('raw_text'):
+            return article['raw_text']
+        
+        parts = (article.get('title'), article.get('description'), article.get('body'))
+        return ' '.join(part for part in parts if part)
+    
     def article_exists(self, article_id=None, url=None):
         """
         Check if article already exists in database.
@@ -119,7 +133,7 @@ class DatabaseManager:
             article.get('author'),
             article.get('published_at'),
             article.get('ticker'),
-            article.get('raw_text'),
+            self._get_raw_text(article),
             article.get('sentiment_score'),
             article.get('sentiment_label'),
             article.get('image'),
@@ -172,7 +186,7 @@ class DatabaseManager:
                 article.get('author'),
                 article.get('published_at'),
                 article.get('ticker'),
-                article.get('raw_text'),
+                self._get_raw_text(article),
                 article.get('sentiment_score'),
                 article.get('sentiment_label'),
                 article.get('image'),
@@ -211,7 +225,31 @@ class DatabaseManager:
         """
         return self.execute_query(query, (ticker, limit), fetch=True)
     
-    def get_articles_by_date_range(self, from_date, to_date, ticker=None):
+    def get_articles_by_tickers(self, tickers, limit=100):
+        """
+        Retrieve the latest articles for several tickers in one query.
+        
+        Args:
+            tickers (list): Stock ticker symbols
+            limit (int): Maximum number of articles per ticker
+        
+        Returns:
+            list: List of article dictionaries, newest first within each ticker
+        """
+        query = """
+            SELECT * FROM (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY ticker ORDER BY published_at DESC
+                ) AS ticker_rank
+                FROM articles
+                WHERE ticker = ANY(%s)
+            ) ranked
+            WHERE ticker_rank <= %s
+            ORDER BY ticker, published_at DESC
+        """
+        return self.execute_query(query, (list(tickers), limit), fetch=True)
+    
+    def get_articles_by_date_range(self, from_date, to_date, ticker=None, limit=None):
         """
         Retrieve articles within a date range.
         
@@ -219,6 +257,7 @@ class DatabaseManager:
             from_date (datetime): Start date
             to_date (datetime): End date
             ticker (str): Optional ticker filter
+            limit (int): Optional max number of articles (newest first)
         
         Returns:
             list: List of article dictionaries
@@ -239,6 +278,11 @@ class DatabaseManager:
             """
             params = (from_date, to_date)
         
+        # Let the database stop early instead of fetching rows we'd drop
+        if limit is not None:
+            query += "LIMIT %s\n"
+            params += (limit,)
+        
         return self.execute_query(query, params, fetch=True)
     
     def get_latest_articles(self, n=50):
@@ -1,5 +1,19 @@
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from utils.json_io import loads, write_json_stream
+
+# Seconds to wait for the Output API
+REQUEST_TIMEOUT = 30
+
+# One keep-alive session for every call to the local Output API
+session = requests.Session()
+session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+session.headers.update({'Accept-Encoding': 'gzip, deflate'})
 
 def export_articles_for_sentiment_analysis():
     """Export articles as JSON for Person 2 (Sentiment Analysis)."""
@@ -13,45 +27,67 @@ def export_articles_for_sentiment_analysis():
     # Tickers to export
     tickers = ['AAPL', 'TSLA', 'MSFT', 'GOOGL', 'AMZN']
     
-    for ticker in tickers:
-        print(f"\n📤 Exporting {ticker} articles...")
+    # Both exports are independent, so request them at the same time
+    # and handle the responses in order below
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # Every ticker's articles in a single request
+        ticker_request = executor.submit(
+            session.get,
+            f"{base_url}/api/export/json",
+            params={'tickers': ','.join(tickers), 'limit': 100},
+            timeout=REQUEST_TIMEOUT
+        )
+        # All recent articles
+        recent_request = executor.submit(
+            session.get,
+            f"{base_url}/api/export/json",
+            params={'limit': 500},
+            timeout=REQUEST_TIMEOUT
+        )
+    
+    print(f"\n📤 Exporting {', '.join(tickers)} articles...")
+    
+    try:
+        response = ticker_request.result()
         
-        try:
-            # Get articles from API
-            response = requests.get(
-                f"{base_url}/export/json",
-                params={'ticker': ticker, 'limit': 100}
-            )
+        if response.status_code == 200:
+            data = loads(response.content)
             
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Save to file
+            # Split the combined result into one list per ticker
+            articles_by_ticker = {ticker: [] for ticker in tickers}
+            for article in data['articles']:
+                for ticker in article.get('tickers', []):
+                    if ticker in articles_by_ticker:
+                        articles_by_ticker[ticker].append(article)
+            
+            # Save one file per ticker
+            for ticker, articles in articles_by_ticker.items():
                 filename = f"{ticker.lower()}_articles.json"
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                write_json_stream(
+                    filename,
+                    articles,
+                    export_time=data.get('export_time'),
+                    ticker=ticker,
+                    count=len(articles)
+                )
                 
-                print(f"✓ Exported {data['count']} articles to {filename}")
-            else:
-                print(f"✗ Error: {response.status_code}")
-        
-        except Exception as e:
-            print(f"✗ Error exporting {ticker}: {e}")
+                print(f"✓ Exported {len(articles)} articles to {filename}")
+        else:
+            print(f"✗ Error: {response.status_code}")
+    
+    except Exception as e:
+        print(f"✗ Error exporting tickers: {e}")
     
     # Also export all recent articles
     print(f"\n📤 Exporting all recent articles...")
     
     try:
-        response = requests.get(
-            f"{base_url}/export/json",
-            params={'limit': 500}
-        )
+        response = recent_request.result()
         
         if response.status_code == 200:
-            data = response.json()
+            data = loads(response.content)
             
-            with open('all_recent_articles.json', 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            write_json_stream('all_recent_articles.json', data.pop('articles'), **data)
             
             print(f"✓ Exported {data['count']} articles to all_recent_articles.json")
     
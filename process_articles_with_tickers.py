@@ -14,6 +14,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from utils.ticker_extractor import TickerExtractor
 from utils.context_extractor import ContextExtractor
+from utils.ticker_database import warm_up_ticker_database
 from database.db_manager import DatabaseManager
 
 
@@ -71,6 +72,9 @@ def process_json_file(input_file='unified_news_data.json', output_file='news_wit
     print("PROCESSING ARTICLES WITH TICKER DETECTION")
     print("="*80)
     
+    # Load the ticker database while the articles are read
+    warm_up_ticker_database()
+    
     # Load articles
     print(f"\n📂 Loading articles from {input_file}...")
     try:
@@ -145,6 +149,9 @@ def update_database_with_tickers():
     print("UPDATING DATABASE WITH TICKER INFORMATION")
     print("="*80)
     
+    # Load the ticker database while we query the articles
+    warm_up_ticker_database()
+    
     db = DatabaseManager()
     
     if not db.connect():
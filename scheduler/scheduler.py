@@ -10,10 +10,8 @@ import sys
 import os
 from datetime import datetime
 import logging
-import json 
 
 # Add after other imports
-import json
 import nltk
 import ssl
 
@@ -64,22 +62,12 @@ def export_articles_for_person_2(processed_articles):
     for ticker, articles in articles_by_ticker.items():
         file_name = f"{ticker}_articles.json"
         file_path = os.path.join(export_dir, file_name)
-        data = {
-            "count": len(articles),
-            "articles": articles
-        }
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json_stream(file_path, articles, count=len(articles))
 
     # Export all recent articles
     all_file_name = "all_recent_articles.json"
     all_file_path = os.path.join(export_dir, all_file_name)
-    data_all = {
-        "count": len(processed_articles),
-        "articles": processed_articles
-    }
-    with open(all_file_path, "w", encoding="utf-8") as f:
-        json.dump(data_all, f, indent=2, ensure_ascii=False)
+    write_json_stream(all_file_path, processed_articles, count=len(processed_articles))
 
     print("\n✓ Real-time export complete for Person 2 format!")
     print("Files created in export_for_person2 directory:")
@@ -93,6 +81,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from scrapers.master_scraper import fetch_all_news_for_multiple_tickers
 from utils.ticker_extractor import TickerExtractor
 from utils.context_extractor import ContextExtractor
+from utils.ticker_database import warm_up_ticker_database
 from preprocessor.text_cleaner import TextCleaner
 from preprocessor.tokenizer import Tokenizer
 from preprocessor.stop_words import StopWordsRemover
@@ -100,6 +89,7 @@ from preprocessor.lemmatizer import Lemmatizer
 from preprocessor.feature_extractor import FeatureExtractor
 from database.db_manager import DatabaseManager
 from database.cache_manager import CacheManager
+from utils.json_io import write_json_stream
 
 # Set up logging
 logging.basicConfig(
@@ -124,14 +114,18 @@ class NewsScheduler:
         logger.info("INITIALIZING NEWS SCHEDULER")
         logger.info("="*80)
         
+        # Load the ticker database in the background while the
+        # preprocessing components start up
+        warm_up_ticker_database()
+        
         # Initialize components
-        self.ticker_extractor = TickerExtractor()
-        self.context_extractor = ContextExtractor()
         self.text_cleaner = TextCleaner()
         self.tokenizer = Tokenizer()
         self.stopwords_remover = StopWordsRemover()
         self.lemmatizer = Lemmatizer()
         self.feature_extractor = FeatureExtractor()
+        self.ticker_extractor = TickerExtractor()
+        self.context_extractor = ContextExtractor()
         
         # Initialize database and cache
         self.db = DatabaseManager()
@@ -2,31 +2,37 @@
 
 import requests
 import time
+import threading
+import logging
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.settings import ALPHAVANTAGE_KEY
 
+logger = logging.getLogger(__name__)
+
 # Rate limiting: Alpha Vantage allows 5 calls per minute
 CALLS_PER_MINUTE = 5
 CALL_INTERVAL = 60 / CALLS_PER_MINUTE  # 12 seconds between calls
 
 last_call_time = 0
+rate_limit_lock = threading.Lock()  # Scrapers may run in parallel threads
 
 
 def rate_limit():
     """Ensure we don't exceed 5 calls per minute."""
     global last_call_time
-    current_time = time.time()
-    time_since_last_call = current_time - last_call_time
-    
-    if time_since_last_call < CALL_INTERVAL:
-        wait_time = CALL_INTERVAL - time_since_last_call
-        print(f"⏳ Rate limiting: waiting {wait_time:.1f} seconds...")
-        time.sleep(wait_time)
-    
-    last_call_time = time.time()
+    with rate_limit_lock:
+        current_time = time.time()
+        time_since_last_call = current_time - last_call_time
+        
+        if time_since_last_call < CALL_INTERVAL:
+            wait_time = CALL_INTERVAL - time_since_last_call
+            logger.info("⏳ Rate limiting: waiting %.1f seconds...", wait_time)
+            time.sleep(wait_time)
+        
+        last_call_time = time.time()
 
 
 def fetch_news_by_ticker(ticker, max_retries=3):
@@ -41,11 +47,11 @@ def fetch_news_by_ticker(ticker, max_retries=3):
         list: List of articles or empty list if error
     """
     
-    print(f"\n🔍 Alpha Vantage: Fetching news for {ticker}")
+    logger.info("🔍 Alpha Vantage: Fetching news for %s", ticker)
     
     # Check API key
     if not ALPHAVANTAGE_KEY or ALPHAVANTAGE_KEY == "your_alphavantage_key_here":
-        print("✗ Error: Alpha Vantage API key not configured!")
+        logger.error("✗ Error: Alpha Vantage API key not configured!")
         return []
     
     # Apply rate limiting
@@ -71,48 +77,48 @@ def fetch_news_by_ticker(ticker, max_retries=3):
                 
                 # Check for API error messages
                 if 'Note' in data:
-                    print(f"✗ API Limit: {data['Note']}")
+                    logger.error("✗ API Limit for %s: %s", ticker, data['Note'])
                     return []
                 
                 if 'Error Message' in data:
-                    print(f"✗ Error: {data['Error Message']}")
+                    logger.error("✗ Error for %s: %s", ticker, data['Error Message'])
                     return []
                 
                 # Extract articles from feed
                 articles = data.get('feed', [])
-                print(f"✓ Found {len(articles)} articles for {ticker}")
+                logger.info("✓ Found %d articles for %s", len(articles), ticker)
                 
                 return articles
             
             elif response.status_code == 429:
-                print("✗ Rate limit exceeded!")
+                logger.error("✗ Rate limit exceeded for %s!", ticker)
                 return []
             
             else:
-                print(f"✗ Error: Status code {response.status_code}")
+                logger.error("✗ Error for %s: Status code %s", ticker, response.status_code)
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
-                    print(f"  Retrying in {wait_time} seconds...")
+                    logger.info("  Retrying %s in %d seconds...", ticker, wait_time)
                     time.sleep(wait_time)
                     continue
                 return []
         
         except requests.exceptions.Timeout:
-            print(f"✗ Timeout (attempt {attempt + 1}/{max_retries})")
+            logger.warning("✗ Timeout for %s (attempt %d/%d)", ticker, attempt + 1, max_retries)
             if attempt < max_retries - 1:
                 time.sleep(2 ** attempt)
                 continue
             return []
         
         except requests.exceptions.ConnectionError:
-            print(f"✗ Connection error (attempt {attempt + 1}/{max_retries})")
+            logger.warning("✗ Connection error for %s (attempt %d/%d)", ticker, attempt + 1, max_retries)
             if attempt < max_retries - 1:
                 time.sleep(2 ** attempt)
                 continue
             return []
         
         except Exception as e:
-            print(f"✗ Unexpected error: {e}")
+            logger.error("✗ Unexpected error for %s: %s", ticker, e)
             return []
     
     return []
@@ -174,5 +180,7 @@ def test_alphavantage():
 
 
 if __name__ == "__main__":
+    # Show progress when run directly (use logging.WARNING for quiet runs)
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     results = test_alphavantage()
     print(f"\n✓ Total articles: {sum(len(a) for a in results.values())}")
\ No newline at end of file
@@ -3,12 +3,15 @@
 import requests
 from datetime import datetime, timedelta
 import time
+import logging
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.settings import FINNHUB_KEY
 
+logger = logging.getLogger(__name__)
+
 
 def get_date_range():
     """Get date range for last 7 days in YYYY-MM-DD format."""
@@ -34,11 +37,11 @@ def fetch_news_by_ticker(ticker, max_retries=3):
         list: List of articles or empty list if error
     """
     
-    print(f"\n🔍 Finnhub: Fetching news for {ticker}")
+    logger.info("🔍 Finnhub: Fetching news for %s", ticker)
     
     # Check API key
     if not FINNHUB_KEY or FINNHUB_KEY == "your_finnhub_key_here":
-        print("✗ Error: Finnhub API key not configured!")
+        logger.error("✗ Error: Finnhub API key not configured!")
         return []
     
     # Get date range
@@ -64,45 +67,45 @@ def fetch_news_by_ticker(ticker, max_retries=3):
                 
                 # Finnhub returns a list directly
                 if isinstance(articles, list):
-                    print(f"✓ Found {len(articles)} articles for {ticker}")
+                    logger.info("✓ Found %d articles for %s", len(articles), ticker)
                     return articles
                 else:
-                    print(f"✗ Unexpected response format")
+                    logger.error("✗ Unexpected response format for %s", ticker)
                     return []
             
             elif response.status_code == 401:
-                print("✗ Invalid API key!")
+                logger.error("✗ Invalid API key!")
                 return []
             
             elif response.status_code == 429:
-                print("✗ Rate limit exceeded!")
+                logger.error("✗ Rate limit exceeded for %s!", ticker)
                 return []
             
             else:
-                print(f"✗ Error: Status code {response.status_code}")
+                logger.error("✗ Error for %s: Status code %s", ticker, response.status_code)
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt
-                    print(f"  Retrying in {wait_time} seconds...")
+                    logger.info("  Retrying %s in %d seconds...", ticker, wait_time)
                     time.sleep(wait_time)
                     continue
                 return []
         
         except requests.exceptions.Timeout:
-            print(f"✗ Timeout (attempt {attempt + 1}/{max_retries})")
+            logger.warning("✗ Timeout for %s (attempt %d/%d)", ticker, attempt + 1, max_retries)
             if attempt < max_retries - 1:
                 time.sleep(2 ** attempt)
                 continue
             return []
         
         except requests.exceptions.ConnectionError:
-            print(f"✗ Connection error (attempt {attempt + 1}/{max_retries})")
+            logger.warning("✗ Connection error for %s (attempt %d/%d)", ticker, attempt + 1, max_retries)
             if attempt < max_retries - 1:
                 time.sleep(2 ** attempt)
                 continue
             return []
         
         except Exception as e:
-            print(f"✗ Unexpected error: {e}")
+            logger.error("✗ Unexpected error for %s: %s", ticker, e)
             return []
     
     return []
@@ -171,5 +174,7 @@ def test_finnhub():
 
 
 if __name__ == "__main__":
+    # Show progress when run directly (use logging.WARNING for quiet runs)
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     results = test_finnhub()
     print(f"\n✓ Total articles: {sum(len(a) for a in results.values())}")
\ No newline at end of file
@@ -0,0 +1,53 @@
+# scrapers/keyword_matcher.py
+"""
+Fast "does this text contain any of these keywords?" checks.
+Used by the scrapers to filter out non-financial articles.
+"""
+
+import re
+
+try:
+    import ahocorasick  # Optional: pyahocorasick scans text once for all keywords
+except ImportError:
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """Match a fixed list of lowercase keywords against lowercase text."""
+    
+    def __init__(self, keywords):
+        """
+        Build the matcher once (at module import in the scrapers).
+        
+        Args:
+            keywords (list): Keywords to look for
+        """
+        self.keywords = tuple(keyword.lower() for keyword in keywords)
+        self.automaton = None
+        self.pattern = None
+        
+        if ahocorasick is None:
+            # Without pyahocorasick, one compiled alternation still scans the
+            # text in C instead of one Python-level `in` check per keyword
+            self.pattern = re.compile('|'.join(re.escape(keyword) for keyword in self.keywords))
+        else:
+            self.automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self.automaton.add_word(keyword, keyword)
+            self.automaton.make_automaton()
+    
+    def search(self, text):
+        """
+        Check if text contains at least one keyword.
+        
+        Args:
+            text (str): Lowercase text to scan
+        
+        Returns:
+            bool: True if any keyword appears in text
+        """
+        if self.automaton is not None:
+            # Single pass over the text, stops at the first hit
+            return next(self.automaton.iter(text), None) is not None
+        
+        return self.pattern.search(text) is not None
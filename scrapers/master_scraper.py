@@ -1,19 +1,27 @@
 # scrapers/master_scraper.py
 
-import json
 import hashlib
+import shelve
+import time
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import logging
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from utils.json_io import write_json
+
 # Import all scrapers
 from scrapers import newsapi_scraper
 from scrapers import alphavantage_scraper
 from scrapers import finnhub_scraper
 from scrapers import rss_scraper
 
+logger = logging.getLogger(__name__)
+
 # Source priority (higher = more reliable)
 SOURCE_PRIORITY = {
     'newsapi': 3,
@@ -22,6 +30,84 @@ SOURCE_PRIORITY = {
     'rss': 1
 }
 
+# Per-ticker sources: (scraper module, source name, display label)
+TICKER_SOURCES = [
+    (newsapi_scraper, 'newsapi', 'NewsAPI'),
+    (alphavantage_scraper, 'alphavantage', 'Alpha Vantage'),
+    (finnhub_scraper, 'finnhub', 'Finnhub'),
+]
+
+# Parallelism limits
+MAX_TICKER_WORKERS = 4        # Tickers processed at the same time
+MAX_CALLS_PER_SOURCE = 2      # In-flight requests allowed per API
+
+# One semaphore per API so ticker fan-out can't flood a rate-limited source
+SOURCE_SEMAPHORES = {
+    source_name: threading.Semaphore(MAX_CALLS_PER_SOURCE)
+    for _, source_name, _ in TICKER_SOURCES
+}
+
+# Standardized articles seen during the current run, keyed by
+# (source_name, title, url). The same story often shows up for several
+# tickers; only 'ticker' and 'scraped_at' differ between those copies.
+# Only filled while fetch_all_news_for_multiple_tickers is running, so
+# direct fetch_all_news_for_ticker calls don't grow it forever.
+standardized_cache = {}
+standardized_cache_active = False
+
+# Standardized articles from previous runs, kept on disk between runs
+# (opened by fetch_all_news_for_multiple_tickers, None otherwise)
+ARTICLE_CACHE_FILE = '.article_cache'
+ARTICLE_CACHE_MAX_AGE_DAYS = 30
+article_cache = None
+article_cache_lock = threading.Lock()  # shelve is not thread-safe
+
+
+def open_article_cache(filename=ARTICLE_CACHE_FILE, max_age_days=ARTICLE_CACHE_MAX_AGE_DAYS):
+    """
+    Open the on-disk article cache and drop entries older than max_age_days.
+    
+    Args:
+        filename (str): Cache file path
+        max_age_days (int): Entries older than this are deleted
+    """
+    global article_cache
+    
+    try:
+        article_cache = shelve.open(filename)
+    except Exception as e:
+        logger.warning("⚠ Could not open article cache %s: %s", filename, e)
+        article_cache = None
+        return
+    
+    try:
+        # Keep the file from growing forever (reading every entry also
+        # catches a corrupt or old-format cache before the run relies on it)
+        oldest_allowed = time.time() - max_age_days * 86400
+        expired = [key for key, (cached_at, _) in article_cache.items() if cached_at < oldest_allowed]
+        for key in expired:
+            del article_cache[key]
+    except Exception as e:
+        logger.warning("⚠ Could not read article cache %s, running without it: %s", filename, e)
+        try:
+            article_cache.close()
+        except Exception:
+            pass
+        article_cache = None
+        return
+    
+    logger.info("✓ Article cache opened (%d articles, %d expired)", len(article_cache), len(expired))
+
+
+def close_article_cache():
+    """Write the on-disk article cache and close it."""
+    global article_cache
+    
+    if article_cache is not None:
+        with article_cache_lock:
+            article_cache.close()
+            article_cache = None
+
 
 def generate_article_id(title, url):
     """
@@ -36,11 +122,12 @@ def generate_article_id(title, url):
     """
     # Combine title and URL
     content = f"{title}|{url}".encode('utf-8')
-    # Create SHA256 hash
-    return hashlib.sha256(content).hexdigest()[:16]
+    # BLAKE2b with an 8-byte digest gives 16 hex chars directly and is much
+    # cheaper than SHA256 (this is a dedup key, not a security boundary)
+    return hashlib.blake2b(content, digest_size=8).hexdigest()
 
 
-def standardize_article(article, source_name, ticker=None):
+def standardize_article(article, source_name, ticker=None, scraped_at=None):
     """
     Convert any article format to unified standard format.
     
@@ -48,6 +135,7 @@ def standardize_article(article, source_name, ticker=None):
         article (dict): Raw article from any source
         source_name (str): Which scraper this came from
         ticker (str): Stock ticker (if available)
+        scraped_at (str): ISO timestamp of the fetch (defaults to now)
     
     Returns:
         dict: Standardized article format
@@ -57,7 +145,24 @@ def standardize_article(article, source_name, ticker=None):
     title = article.get('title', 'No title')
     url = article.get('url', article.get('link', ''))
     
-    # Create standardized article
+    # Reuse the article if another ticker already standardized it this run
+    cache_key = (source_name, title, url)
+    cached = standardized_cache.get(cache_key)
+    
+    # Otherwise reuse it if a previous run already standardized it
+    persistent_key = f"{source_name}|{url}|{title}"
+    if cached is None and article_cache is not None:
+        with article_cache_lock:
+            entry = article_cache.get(persistent_key)
+        if entry is not None:
+            cached = entry[1]
+            if standardized_cache_active:
+                standardized_cache[cache_key] = cached
+    
+    if cached is not None:
+        return {**cached, 'ticker': ticker, 'scraped_at': scraped_at or datetime.now().isoformat()}
+    
+    # Not cached - only now is the article ID worth hashing
     standardized = {
         'article_id': generate_article_id(title, url),
         'title': title,
@@ -69,9 +174,8 @@ def standardize_article(article, source_name, ticker=None):
         'url': url,
         'author': article.get('author', 'Unknown'),
         'published_at': article.get('published_at', ''),
-        'scraped_at': datetime.now().isoformat(),
+        'scraped_at': scraped_at or datetime.now().isoformat(),
         'ticker': ticker,
-        'raw_text': f"{title} {article.get('description', '')} {article.get('content', '')}",
         
         # Extra fields from specific sources
         'sentiment_score': article.get('sentiment_score'),
@@ -80,6 +184,13 @@ def standardize_article(article, source_name, ticker=None):
         'category': article.get('category')
     }
     
+    cached = dict(standardized)  # Callers may modify theirs
+    if standardized_cache_active:
+        standardized_cache[cache_key] = cached
+    
+    if article_cache is not None:
+        with article_cache_lock:
+            article_cache[persistent_key] = (time.time(), cached)
     return standardized
 
 
@@ -96,20 +207,16 @@ def remove_duplicates(articles):
     """
     
     seen = {}  # article_id -> article
+    seen_priority = {}  # article_id -> priority of the article we kept
     
     for article in articles:
         article_id = article['article_id']
+        priority = article['source_priority']
         
-        # If we haven't seen this article, add it
-        if article_id not in seen:
+        # Keep the first article we see, unless a later one has higher priority
+        if priority > seen_priority.get(article_id, -1):
             seen[article_id] = article
-        else:
-            # We've seen it - keep the one with higher priority
-            existing_priority = seen[article_id]['source_priority']
-            new_priority = article['source_priority']
-            
-            if new_priority > existing_priority:
-                seen[article_id] = article
+            seen_priority[article_id] = priority
     
     return list(seen.values())
 
@@ -125,53 +232,46 @@ def fetch_all_news_for_ticker(ticker):
         list: Unified list of articles from all sources
     """
     
-    print(f"\n{'='*80}")
-    print(f"FETCHING ALL NEWS FOR: {ticker}")
-    print(f"{'='*80}")
+    logger.info("FETCHING ALL NEWS FOR: %s", ticker)
     
     all_articles = []
     
-    # 1. Fetch from NewsAPI
-    print("\n1️⃣ Fetching from NewsAPI...")
-    try:
-        newsapi_articles = newsapi_scraper.fetch_news_by_ticker(ticker)
-        for article in newsapi_articles:
-            cleaned = newsapi_scraper.extract_article_info(article)
-            standardized = standardize_article(cleaned, 'newsapi', ticker)
-            all_articles.append(standardized)
-        print(f"✓ Added {len(newsapi_articles)} from NewsAPI")
-    except Exception as e:
-        print(f"✗ NewsAPI error: {e}")
-    
-    # 2. Fetch from Alpha Vantage
-    print("\n2️⃣ Fetching from Alpha Vantage...")
-    try:
-        av_articles = alphavantage_scraper.fetch_news_by_ticker(ticker)
-        for article in av_articles:
-            cleaned = alphavantage_scraper.extract_article_info(article)
-            standardized = standardize_article(cleaned, 'alphavantage', ticker)
-            all_articles.append(standardized)
-        print(f"✓ Added {len(av_articles)} from Alpha Vantage")
-    except Exception as e:
-        print(f"✗ Alpha Vantage error: {e}")
-    
-    # 3. Fetch from Finnhub
-    print("\n3️⃣ Fetching from Finnhub...")
-    try:
-        finnhub_articles = finnhub_scraper.fetch_news_by_ticker(ticker)
-        for article in finnhub_articles:
-            cleaned = finnhub_scraper.extract_article_info(article)
-            standardized = standardize_article(cleaned, 'finnhub', ticker)
-            all_articles.append(standardized)
-        print(f"✓ Added {len(finnhub_articles)} from Finnhub")
-    except Exception as e:
-        print(f"✗ Finnhub error: {e}")
+    # One timestamp for the whole fetch rather than one clock read per article
+    scraped_at = datetime.now().isoformat()
+    
+    def fetch_from_source(scraper, source_name):
+        """Fetch and standardize articles from a single source."""
+        with SOURCE_SEMAPHORES[source_name]:
+            raw_articles = scraper.fetch_news_by_ticker(ticker)
+        # IDs are only hashed for articles neither cache has seen yet
+        return [
+            standardize_article(scraper.extract_article_info(article), source_name, ticker, scraped_at=scraped_at)
+            for article in raw_articles
+        ]
+    
+    # 1-3. Fetch from NewsAPI, Alpha Vantage and Finnhub concurrently
+    # (each call is network-bound, so total time is the slowest source)
+    logger.info("🔍 Fetching from NewsAPI, Alpha Vantage and Finnhub in parallel...")
+    with ThreadPoolExecutor(max_workers=len(TICKER_SOURCES)) as executor:
+        futures = [
+            (executor.submit(fetch_from_source, scraper, source_name), label)
+            for scraper, source_name, label in TICKER_SOURCES
+        ]
+        
+        # Collect in source order so deduplication stays deterministic
+        for future, label in futures:
+            try:
+                articles = future.result()
+                all_articles.extend(articles)
+                logger.info("✓ Added %d from %s for %s", len(articles), label, ticker)
+            except Exception as e:
+                logger.error("✗ %s error for %s: %s", label, ticker, e)
     
     # 4. Remove duplicates (keep highest priority)
-    print(f"\n4️⃣ Removing duplicates...")
-    print(f"   Before deduplication: {len(all_articles)} articles")
+    articles_before = len(all_articles)
     all_articles = remove_duplicates(all_articles)
-    print(f"   After deduplication: {len(all_articles)} articles")
+    logger.info("Removed duplicates for %s: %d -> %d articles",
+                ticker, articles_before, len(all_articles))
     
     return all_articles
 
@@ -187,18 +287,31 @@ def fetch_all_news_for_multiple_tickers(tickers):
         dict: Dictionary with ticker as key and list of articles as value
     """
     
-    print("\n" + "🚀"*40)
-    print("MASTER SCRAPER - COLLECTING FROM ALL SOURCES")
-    print("🚀"*40)
+    logger.info("🚀 MASTER SCRAPER - COLLECTING FROM ALL SOURCES")
+    
+    global standardized_cache_active
     
     all_results = {}
     
-    for i, ticker in enumerate(tickers):
-        print(f"\n[{i+1}/{len(tickers)}] Processing: {ticker}")
-        articles = fetch_all_news_for_ticker(ticker)
-        all_results[ticker] = articles
-        
-        print(f"✓ Total unique articles for {ticker}: {len(articles)}")
+    # Start each run with an empty in-memory cache, backed by the disk cache
+    standardized_cache.clear()
+    standardized_cache_active = True
+    open_article_cache()
+    
+    try:
+        # Tickers are independent, so overlap them in a bounded pool
+        with ThreadPoolExecutor(max_workers=MAX_TICKER_WORKERS) as executor:
+            results = executor.map(fetch_all_news_for_ticker, tickers)
+            
+            for i, (ticker, articles) in enumerate(zip(tickers, results)):
+                all_results[ticker] = articles
+                logger.info("[%d/%d] ✓ Total unique articles for %s: %d",
+                            i + 1, len(tickers), ticker, len(articles))
+    finally:
+        # Free the cached copies and save the disk cache once the run is done
+        standardized_cache_active = False
+        standardized_cache.clear()
+        close_article_cache()
     
     return all_results
 
@@ -213,25 +326,25 @@ def save_unified_data(data, filename='unified_news_data.json'):
     """
     
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json(data, filename)
         
         total_articles = sum(len(articles) for articles in data.values())
-        print(f"\n✅ Saved {total_articles} articles to {filename}")
+        logger.info("✅ Saved %d articles to %s", total_articles, filename)
         
-        # Print summary by source
-        source_counts = {}
-        for articles in data.values():
-            for article in articles:
-                source_api = article['source_api']
-                source_counts[source_api] = source_counts.get(source_api, 0) + 1
-        
-        print("\n📊 Articles by source:")
-        for source, count in sorted(source_counts.items()):
-            print(f"   {source}: {count} articles")
+        # Log summary by source (skip the counting when nobody will see it)
+        if logger.isEnabledFor(logging.INFO):
+            source_counts = {}
+            for articles in data.values():
+                for article in articles:
+                    source_api = article['source_api']
+                    source_counts[source_api] = source_counts.get(source_api, 0) + 1
+            
+            logger.info("📊 Articles by source:")
+            for source, count in sorted(source_counts.items()):
+                logger.info("   %s: %d articles", source, count)
         
     except Exception as e:
-        print(f"✗ Error saving data: {e}")
+        logger.error("✗ Error saving data: %s", e)
 
 
 def test_master_scraper():
@@ -258,5 +371,7 @@ def test_master_scraper():
 
 
 if __name__ == "__main__":
+    # Show progress when run directly (use logging.WARNING for quiet runs)
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     results = test_master_scraper()
     print("\n🎉 Master scraper test complete!")
\ No newline at end of file
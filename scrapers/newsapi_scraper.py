@@ -3,9 +3,16 @@
 # IMPORT SECTION
 # These are tools/libraries we need
 import requests  # To make HTTP requests to APIs
+from requests.adapters import HTTPAdapter  # Connection pooling
+from urllib3.util.retry import Retry  # Retry dropped connections
+try:
+    import requests_cache  # Optional: caches API responses on disk
+except ImportError:
+    requests_cache = None
 from datetime import datetime, timedelta  # To work with dates
 import time  # To add delays between requests
-import json  # To work with JSON data
+import logging  # Progress messages (shown when run directly)
+from urllib.parse import urlparse  # To pull the hostname out of article URLs
 import sys
 import os
 
@@ -13,6 +20,37 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.settings import NEWSAPI_KEY  # Import your API key
+from scrapers.keyword_matcher import KeywordMatcher
+from utils.json_io import write_json  # Fast JSON file writing
+
+logger = logging.getLogger(__name__)
+
+
+# HTTP SESSION
+# One shared session keeps the TCP/TLS connection to newsapi.org open
+# between tickers instead of reconnecting for every request.
+#
+# Free tier only allows 100 requests per day, and the 7-day window barely
+# changes between runs, so when requests-cache is installed identical
+# responses are reused for 30 minutes. Only successful responses are cached,
+# and the API key is left out of the cache key so it is never written to disk.
+CACHE_EXPIRE_SECONDS = 30 * 60
+
+if requests_cache is not None:
+    session = requests_cache.CachedSession(
+        'newsapi_cache',
+        expire_after=CACHE_EXPIRE_SECONDS,
+        allowable_codes=(200,),
+        ignored_parameters=['apiKey']
+    )
+else:
+    session = requests.Session()  # No cache available, call the API directly
+
+session.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+))
 
 
 # COMPANY TICKER MAPPING
@@ -33,6 +71,8 @@ TICKER_TO_COMPANY = {
 
 # FINANCIAL NEWS DOMAINS
 # Only scrape from these trusted financial news sources
+# NOTE: the domain and keyword lists below are compiled into lookup
+# structures once at import - changing them at runtime has no effect.
 FINANCIAL_DOMAINS = [
     "bloomberg.com",
     "reuters.com",
@@ -51,6 +91,11 @@ FINANCIAL_DOMAINS = [
     "investopedia.com"
 ]
 
+# Precomputed (lowercased) for hostname matching: exact host, or any subdomain
+# of it (".ft.com" so that e.g. "microsoft.com" doesn't count as ft.com)
+FINANCIAL_DOMAIN_SET = frozenset(domain.lower() for domain in FINANCIAL_DOMAINS)
+FINANCIAL_DOMAIN_SUFFIXES = tuple(f".{domain}" for domain in FINANCIAL_DOMAIN_SET)
+
 # FINANCIAL KEYWORDS
 # Articles must contain at least one of these to be considered financial
 FINANCIAL_KEYWORDS = [
@@ -60,6 +105,9 @@ FINANCIAL_KEYWORDS = [
     "forecast", "valuation", "dividend", "shareholder", "ipo"
 ]
 
+# Built once so every article is scanned in a single pass
+FINANCIAL_KEYWORD_MATCHER = KeywordMatcher(FINANCIAL_KEYWORDS)
+
 
 def is_financial_article(article):
     """
@@ -71,25 +119,34 @@ def is_financial_article(article):
     Returns:
         bool: True if article is financial, False otherwise
     """
-    # Get article URL and convert to lowercase
-    url = article.get('url', '').lower()
-    
-    # Check if article is from a financial domain
-    is_from_financial_domain = any(domain in url for domain in FINANCIAL_DOMAINS)
-    
-    # Get text content to search for keywords
-    title = (article.get('title') or '').lower()
-    description = (article.get('description') or '').lower()
-    content = (article.get('content') or '').lower()
-    
-    # Combine all text
-    full_text = f"{title} {description} {content}"
+    # Get article hostname and convert to lowercase
+    # (a malformed URL like "https://[::1/" just has no hostname)
+    try:
+        host = (urlparse(article.get('url') or '').hostname or '').lower()
+    except ValueError:
+        host = ''
+    
+    # Check if article is from a financial domain (or one of its subdomains)
+    is_from_financial_domain = (
+        host in FINANCIAL_DOMAIN_SET or host.endswith(FINANCIAL_DOMAIN_SUFFIXES)
+    )
+    
+    # Financial domain is enough - no need to scan the text
+    if is_from_financial_domain:
+        return True
+    
+    # Combine all text and lowercase it in one go
+    full_text = ' '.join(filter(None, (
+        article.get('title'),
+        article.get('description'),
+        article.get('content')
+    ))).lower()
     
     # Check if article contains financial keywords
-    contains_financial_keywords = any(keyword in full_text for keyword in FINANCIAL_KEYWORDS)
+    contains_financial_keywords = FINANCIAL_KEYWORD_MATCHER.search(full_text)
     
-    # Article must be from financial domain OR contain financial keywords
-    return is_from_financial_domain or contains_financial_keywords
+    # Not from a financial domain, so it must contain financial keywords
+    return contains_financial_keywords
 
 
 def get_date_range():
@@ -112,8 +169,8 @@ def get_date_range():
     from_date = seven_days_ago.strftime("%Y-%m-%d")
     to_date = today.strftime("%Y-%m-%d")
     
-    # Print so you can see what dates we're using
-    print(f"Fetching news from {from_date} to {to_date} (Last 7 days)")
+    # Log so you can see what dates we're using
+    logger.info("Fetching news from %s to %s (Last 7 days)", from_date, to_date)
     
     return from_date, to_date
 
@@ -134,7 +191,7 @@ def fetch_news_by_ticker(ticker):
     
     # STEP 2: Get company name for this ticker
     company_name = TICKER_TO_COMPANY.get(ticker, ticker)
-    print(f"\nSearching for: {ticker} ({company_name})")
+    logger.info("Searching for: %s (%s)", ticker, company_name)
     
     # STEP 3: Build the search query with financial keywords
     # We search for ticker/company AND add financial context
@@ -153,12 +210,12 @@ def fetch_news_by_ticker(ticker):
         'apiKey': NEWSAPI_KEY         # Your API key
     }
     
-    print(f"Making request to NewsAPI...")
+    logger.info("Making request to NewsAPI for %s...", ticker)
     
     # STEP 5: Make the API request
     try:
         # Send GET request to NewsAPI
-        response = requests.get(base_url, params=params, timeout=10)
+        response = session.get(base_url, params=params, timeout=10)
         
         # Check if request was successful (status code 200 = OK)
         if response.status_code == 200:
@@ -169,42 +226,42 @@ def fetch_news_by_ticker(ticker):
             articles = data.get('articles', [])
             total_results = data.get('totalResults', 0)
             
-            print(f"✓ Success! Found {total_results} total articles")
+            logger.info("✓ Success! Found %d total articles for %s", total_results, ticker)
             
             # FILTER: Only keep financial articles
             financial_articles = [article for article in articles if is_financial_article(article)]
             
-            print(f"✓ Filtered to {len(financial_articles)} financial articles")
+            logger.info("✓ Filtered to %d financial articles for %s", len(financial_articles), ticker)
             
             return financial_articles
             
         elif response.status_code == 429:
             # Rate limit exceeded
-            print("✗ Error: Rate limit exceeded. You've made too many requests.")
-            print("  Free tier allows 100 requests per day.")
+            logger.error("✗ Error: Rate limit exceeded. You've made too many requests. "
+                         "Free tier allows 100 requests per day.")
             return []
             
         elif response.status_code == 401:
             # Invalid API key
-            print("✗ Error: Invalid API key. Check your .env file.")
+            logger.error("✗ Error: Invalid API key. Check your .env file.")
             return []
             
         else:
             # Some other error
-            print(f"✗ Error: API returned status code {response.status_code}")
-            print(f"  Message: {response.text}")
+            logger.error("✗ Error: API returned status code %s for %s. Message: %s",
+                         response.status_code, ticker, response.text)
             return []
     
     except requests.exceptions.Timeout:
-        print("✗ Error: Request timed out. API took too long to respond.")
+        logger.error("✗ Error: Request timed out for %s. API took too long to respond.", ticker)
         return []
     
     except requests.exceptions.ConnectionError:
-        print("✗ Error: Could not connect to NewsAPI. Check your internet.")
+        logger.error("✗ Error: Could not connect to NewsAPI. Check your internet.")
         return []
     
     except Exception as e:
-        print(f"✗ Unexpected error: {e}")
+        logger.error("✗ Unexpected error for %s: %s", ticker, e)
         return []
 
 
@@ -274,17 +331,16 @@ def save_to_json(all_results, filename='news_data.json'):
     
     # Save to JSON file
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(cleaned_results, f, indent=4, ensure_ascii=False)
+        write_json(cleaned_results, filepath)
         
-        print(f"\n✓ Saved all articles to: {filepath}")
+        logger.info("✓ Saved all articles to: %s", filepath)
         
         # Calculate total articles
         total_articles = sum(len(articles) for articles in cleaned_results.values())
-        print(f"✓ Total articles saved: {total_articles}")
+        logger.info("✓ Total articles saved: %d", total_articles)
         
     except Exception as e:
-        print(f"\n✗ Error saving to JSON: {e}")
+        logger.error("✗ Error saving to JSON: %s", e)
 
 
 def test_newsapi():
@@ -360,6 +416,9 @@ def test_newsapi():
 
 # This runs when you execute the file directly
 if __name__ == "__main__":
+    # Show progress when run directly (use logging.WARNING for quiet runs)
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     # Run the test
     results = test_newsapi()
     
@@ -1,8 +1,24 @@
 # scrapers/rss_scraper.py
 
 import feedparser
-from datetime import datetime, timedelta
-import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+import logging
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.keyword_matcher import KeywordMatcher
+
+try:
+    from lxml import etree  # Optional: native XML parser for plain RSS feeds
+except ImportError:
+    etree = None
+
+logger = logging.getLogger(__name__)
 
 # List of financial RSS feeds
 RSS_FEEDS = {
@@ -13,7 +29,11 @@ RSS_FEEDS = {
     'Benzinga': 'https://www.benzinga.com/feed'
 }
 
+# Seconds to wait for a feed to download
+FEED_TIMEOUT = 10
+
 # Financial keywords to filter articles
+# (compiled into FINANCIAL_KEYWORD_MATCHER at import - edit the list, not the matcher)
 FINANCIAL_KEYWORDS = [
     "stock", "shares", "market", "trading", "investor", "investment",
     "earnings", "revenue", "profit", "quarter", "financial", "price",
@@ -21,14 +41,18 @@ FINANCIAL_KEYWORDS = [
     "forecast", "valuation", "dividend", "shareholder", "ipo"
 ]
 
+# Built once so every entry is scanned in a single pass
+FINANCIAL_KEYWORD_MATCHER = KeywordMatcher(FINANCIAL_KEYWORDS)
 
-def is_recent(published_date, days=7):
+
+def is_recent(published_date, days=7, cutoff_date=None):
     """
     Check if article is from the last N days.
     
     Args:
         published_date: Article publish date (struct_time)
         days (int): Number of days to look back
+        cutoff_date (datetime): Precomputed cutoff (overrides days)
     
     Returns:
         bool: True if article is recent
@@ -39,7 +63,8 @@ def is_recent(published_date, days=7):
     try:
         # Convert struct_time to datetime
         article_date = datetime(*published_date[:6])
-        cutoff_date = datetime.now() - timedelta(days=days)
+        if cutoff_date is None:
+            cutoff_date = datetime.now() - timedelta(days=days)
         
         return article_date >= cutoff_date
     except:
@@ -58,43 +83,136 @@ def is_financial_content(title, summary):
         bool: True if content contains financial keywords
     """
     text = f"{title} {summary}".lower()
-    return any(keyword in text for keyword in FINANCIAL_KEYWORDS)
+    return FINANCIAL_KEYWORD_MATCHER.search(text)
+
+
+def parse_rss_date(date_text):
+    """
+    Convert an RSS pubDate string to a UTC struct_time (like feedparser does).
+    
+    Args:
+        date_text (str): RFC 822 date, e.g. "Tue, 10 Jun 2025 14:30:00 GMT"
+    
+    Returns:
+        struct_time or None if the date can't be parsed
+    """
+    if not date_text:
+        return None
+    
+    try:
+        dt = parsedate_to_datetime(date_text.strip())
+    except (TypeError, ValueError):
+        return None
+    
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    return dt.timetuple()
 
 
-def fetch_rss_feed(feed_name, feed_url):
+def parse_feed_entries(content):
+    """
+    Parse raw feed bytes into a list of entries.
+    
+    Plain RSS 2.0 feeds are parsed with lxml when it is installed, which is
+    much faster than feedparser. Anything else (Atom, RDF, broken XML, or
+    items dated some other way than a readable pubDate, e.g. dc:date) goes
+    through feedparser as before.
+    
+    Args:
+        content (bytes): Raw feed document
+    
+    Returns:
+        list: Entries with title, summary, link and published_parsed
+    """
+    if etree is not None:
+        try:
+            parser = etree.XMLParser(recover=True, resolve_entities=False, no_network=True)
+            root = etree.fromstring(content, parser=parser)
+        except etree.XMLSyntaxError:
+            root = None
+        
+        if root is not None:
+            entries = [
+                {
+                    'title': item.findtext('title') or 'No title',
+                    'summary': item.findtext('description') or '',
+                    'link': (item.findtext('link') or '').strip(),
+                    'published_parsed': parse_rss_date(item.findtext('pubDate'))
+                }
+                for item in root.iterfind('.//item')
+            ]
+            # Without a date every entry would fail the recency check, while
+            # feedparser also reads dc:date, updated and published
+            if entries and all(entry['published_parsed'] is not None for entry in entries):
+                return entries
+    
+    # Fall back to feedparser for every other feed format
+    feed = feedparser.parse(content)
+    
+    # Check if feed was parsed successfully
+    if feed.bozo:  # bozo = parsing error
+        logger.warning("✗ Warning: Feed may have errors")
+    
+    return feed.entries
+
+
+def fetch_rss_feed(feed_name, feed_url, cutoff_date=None):
     """
     Parse a single RSS feed.
     
     Args:
         feed_name (str): Name of the feed
         feed_url (str): URL of the RSS feed
+        cutoff_date (datetime): Ignore entries older than this (default: 7 days)
     
     Returns:
         list: List of articles from this feed
     """
     
-    print(f"\n🔍 RSS: Parsing {feed_name}")
+    logger.info("🔍 RSS: Parsing %s", feed_name)
     
     try:
+        # Download the feed ourselves so the request honours a timeout
+        # (feedparser's built-in fetch can hang indefinitely)
+        response = requests.get(feed_url, timeout=FEED_TIMEOUT)
+        response.raise_for_status()
+        
         # Parse the RSS feed
-        feed = feedparser.parse(feed_url)
+        entries = parse_feed_entries(response.content)
         
-        # Check if feed was parsed successfully
-        if feed.bozo:  # bozo = parsing error
-            print(f"✗ Warning: Feed may have errors")
+        if cutoff_date is None:
+            cutoff_date = datetime.now() - timedelta(days=7)
         
         articles = []
         
+        # Most feeds list newest entries first. If every dated entry is no
+        # newer than the one before it, the first old entry means the rest
+        # are old too, so we can stop early instead of checking every
+        # remaining entry. Any other order is scanned in full.
+        dates = [
+            tuple(entry['published_parsed'][:6])
+            for entry in entries
+            if entry.get('published_parsed')
+        ]
+        newest_first = all(earlier >= later for earlier, later in zip(dates, dates[1:]))
+        
         # Loop through entries in the feed
-        for entry in feed.entries:
+        for entry in entries:
             # Extract information
+            published = entry.get('published_parsed', None)
+            
+            # Filter 1: only recent articles (cheap date check first)
+            if not is_recent(published, cutoff_date=cutoff_date):
+                if published and newest_first:
+                    break
+                continue
+            
             title = entry.get('title', 'No title')
             summary = entry.get('summary', entry.get('description', ''))
             link = entry.get('link', '')
-            published = entry.get('published_parsed', None)
             
-            # Filter: only recent financial articles
-            if is_recent(published, days=7) and is_financial_content(title, summary):
+            # Filter 2: only financial articles
+            if is_financial_content(title, summary):
                 article = {
                     'title': title,
                     'summary': summary,
@@ -104,11 +222,11 @@ def fetch_rss_feed(feed_name, feed_url):
                 }
                 articles.append(article)
         
-        print(f"✓ Found {len(articles)} relevant articles from {feed_name}")
+        logger.info("✓ Found %d relevant articles from %s", len(articles), feed_name)
         return articles
     
     except Exception as e:
-        print(f"✗ Error parsing {feed_name}: {e}")
+        logger.error("✗ Error parsing %s: %s", feed_name, e)
         return []
 
 
@@ -151,23 +269,26 @@ def fetch_all_rss_feeds():
         list: Combined list of all articles
     """
     
-    print("\n" + "="*80)
-    print("FETCHING RSS FEEDS")
-    print("="*80)
+    logger.info("FETCHING RSS FEEDS")
     
     all_articles = []
     
-    for feed_name, feed_url in RSS_FEEDS.items():
-        articles = fetch_rss_feed(feed_name, feed_url)
-        all_articles.extend(articles)
+    # Same 7-day cutoff for every feed in this run
+    cutoff_date = datetime.now() - timedelta(days=7)
+    
+    # Every feed lives on a different host, so fetch them all at once
+    with ThreadPoolExecutor(max_workers=len(RSS_FEEDS)) as executor:
+        results = executor.map(
+            fetch_rss_feed,
+            RSS_FEEDS.keys(),
+            RSS_FEEDS.values(),
+            [cutoff_date] * len(RSS_FEEDS)
+        )
         
-        # Be polite - wait between requests
-        time.sleep(1)
+        for articles in results:
+            all_articles.extend(articles)
     
-    print("\n" + "="*80)
-    print("SUMMARY")
-    print("="*80)
-    print(f"Total articles from all RSS feeds: {len(all_articles)}")
+    logger.info("Total articles from all RSS feeds: %d", len(all_articles))
     
     return all_articles
 
@@ -189,5 +310,7 @@ def test_rss():
 
 
 if __name__ == "__main__":
+    # Show progress when run directly (use logging.WARNING for quiet runs)
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     results = test_rss()
     print(f"\n✓ Test complete! Found {len(results)} financial articles")
\ No newline at end of file
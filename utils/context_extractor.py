@@ -7,28 +7,65 @@ This helps sentiment analysis understand WHY a ticker was mentioned.
 import re
 import os
 import sys
+from bisect import bisect_right
+from functools import lru_cache
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Load ticker database with fallback
-try:
-    from utils.ticker_database import load_ticker_database
-except ImportError:
+def load_ticker_database():
+    """
+    Load the ticker database on first use and share it afterwards.
+    
+    Nothing is imported or parsed until the first ContextExtractor is
+    created, so importing this module stays cheap. utils.ticker_database
+    caches a successful load itself and retries after a failed one, so
+    nothing is cached here.
+    
+    Returns:
+        tuple: (ticker_to_company, company_to_ticker) dicts
+    """
+    try:
+        from utils.ticker_database import load_ticker_database as load_database
+        return load_database()
+    except ImportError:
+        pass
+    
     # Fallback: load directly from JSON
-    def load_ticker_database():
-        import json
-        filepath = os.path.join(os.path.dirname(__file__), 'ticker_database.json')
-        try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-            return data.get('ticker_to_company', {}), data.get('company_to_ticker', {})
-        except:
-            return {}, {}
+    from utils.json_io import loads  # orjson when installed
+    filepath = os.path.join(os.path.dirname(__file__), 'ticker_database.json')
+    try:
+        with open(filepath, 'rb') as f:
+            data = loads(f.read())
+        return data.get('ticker_to_company', {}), data.get('company_to_ticker', {})
+    except:
+        return {}, {}
+
+# A word is any run of non-whitespace, same as str.split()
+WORD_PATTERN = re.compile(r'\S+')
 
 
 class ContextExtractor:
     """Extract context around ticker mentions in text."""
     
+    # Sentiment keywords to prioritize
+    SENTIMENT_KEYWORDS = {
+        'positive': ['surge', 'gain', 'up', 'rise', 'beat', 'exceed', 'strong', 
+                    'growth', 'profit', 'success', 'bullish', 'rally'],
+        'negative': ['fall', 'drop', 'down', 'loss', 'miss', 'weak', 'decline',
+                    'bearish', 'crash', 'plunge', 'slump', 'concern']
+    }
+    
+    # Finds every sentiment keyword in one pass. The lookahead lets matches
+    # overlap, so each keyword contained in the text is found, same as a
+    # separate `word in text` check per keyword.
+    SENTIMENT_PATTERN = re.compile('(?=(' + '|'.join(
+        re.escape(word)
+        for word in sorted(
+            {word for words in SENTIMENT_KEYWORDS.values() for word in words},
+            key=len, reverse=True
+        )
+    ) + '))')
+    
     def __init__(self, context_window=10):
         """
         Initialize context extractor.
@@ -39,6 +76,13 @@ class ContextExtractor:
         self.context_window = context_window
         self.ticker_to_company, self.company_to_ticker = load_ticker_database()
         
+        # Word offsets of the last text we scanned: (text, words, starts, ends).
+        # Every mention in the same article reuses them instead of re-splitting.
+        self._word_index = (None, [], [], [])
+        
+        # Compiled $TICKER patterns, one per ticker
+        self._dollar_patterns = {}
+        
         print(f"🔧 Context Extractor initialized (window: {context_window} words)")
     
     def extract_context_for_ticker(self, text, ticker):
@@ -64,26 +108,32 @@ class ContextExtractor:
             company_contexts = self._find_company_name_contexts(text, company_name)
             contexts.extend(company_contexts)
         
-        # Remove duplicates while preserving order
-        unique_contexts = []
-        seen = set()
+        return self._unique_contexts(contexts)
+    
+    def _unique_contexts(self, contexts):
+        """Remove duplicate contexts (ignoring case) while preserving order."""
+        # Contexts are words joined by single spaces, so they never need
+        # stripping - lowercasing each one once is enough
+        seen = {}
         for ctx in contexts:
-            ctx_normalized = ctx.lower().strip()
-            if ctx_normalized not in seen:
-                unique_contexts.append(ctx)
-                seen.add(ctx_normalized)
+            key = ctx.lower()
+            if key not in seen:
+                seen[key] = ctx
         
-        return unique_contexts
+        return list(seen.values())
     
     def _find_dollar_ticker_contexts(self, text, ticker):
         """Find contexts around $TICKER mentions."""
         contexts = []
         
-        # Pattern to find $TICKER
-        pattern = rf'\${ticker}\b'
+        # Pattern to find $TICKER (compiled once per ticker)
+        pattern = self._dollar_patterns.get(ticker)
+        if pattern is None:
+            pattern = re.compile(rf'\${re.escape(ticker)}\b', re.IGNORECASE)
+            self._dollar_patterns[ticker] = pattern
         
         # Find all matches
-        for match in re.finditer(pattern, text, re.IGNORECASE):
+        for match in pattern.finditer(text):
             context = self._extract_window_around_position(text, match.start(), match.end())
             contexts.append(context)
         
@@ -97,23 +147,54 @@ class ContextExtractor:
         text_lower = text.lower()
         company_lower = company_name.lower()
         
+        # Most articles never mention the company - stop after one scan
+        pos = text_lower.find(company_lower)
+        if pos == -1:
+            return contexts
+        
         # Find all occurrences
-        pos = 0
-        while True:
-            pos = text_lower.find(company_lower, pos)
-            if pos == -1:
-                break
-            
+        find = text_lower.find
+        company_length = len(company_lower)
+        while pos != -1:
             # Extract context
-            end_pos = pos + len(company_lower)
+            end_pos = pos + company_length
             context = self._extract_window_around_position(text, pos, end_pos)
             contexts.append(context)
             
             # Move to next occurrence
-            pos = end_pos
+            pos = find(company_lower, end_pos)
         
         return contexts
     
+    def _get_word_index(self, text):
+        """
+        Get the words of a text with their start and end offsets.
+        
+        Built once per text and reused for every mention in it.
+        
+        Args:
+            text (str): Full text
+        
+        Returns:
+            tuple: (words, word_starts, word_ends) lists
+        """
+        cached_text, words, word_starts, word_ends = self._word_index
+        if cached_text is text or cached_text == text:
+            return words, word_starts, word_ends
+        
+        # Split text into words and their positions in one pass
+        words = []
+        word_starts = []
+        word_ends = []
+        for match in WORD_PATTERN.finditer(text):
+            words.append(match.group())
+            word_starts.append(match.start())
+            word_ends.append(match.end())
+        
+        # Single assignment, so threads sharing the extractor never see a mix
+        self._word_index = (text, words, word_starts, word_ends)
+        return words, word_starts, word_ends
+    
     def _extract_window_around_position(self, text, start_pos, end_pos):
         """
         Extract N words before and after a position.
@@ -126,24 +207,18 @@ class ContextExtractor:
         Returns:
             str: Context window
         """
-        # Split text into words
-        words = text.split()
-        
-        # Find word positions
-        word_positions = []
-        current_pos = 0
-        for word in words:
-            word_start = text.find(word, current_pos)
-            word_end = word_start + len(word)
-            word_positions.append((word_start, word_end, word))
-            current_pos = word_end
-        
-        # Find which word contains our ticker
+        words, word_starts, word_ends = self._get_word_index(text)
+        
+        # Find which word contains our ticker (binary search on word starts)
         ticker_word_index = None
-        for i, (w_start, w_end, word) in enumerate(word_positions):
-            if w_start <= start_pos < w_end or w_start < end_pos <= w_end:
+        i = bisect_right(word_starts, start_pos) - 1
+        if i >= 0 and start_pos < word_ends[i]:
+            ticker_word_index = i
+        else:
+            # Mention starts in whitespace - use the word its end falls in
+            i = bisect_right(word_starts, end_pos - 1) - 1
+            if i >= 0 and word_starts[i] < end_pos <= word_ends[i]:
                 ticker_word_index = i
-                break
         
         if ticker_word_index is None:
             return ""
@@ -196,49 +271,46 @@ class ContextExtractor:
         Returns:
             str: Most relevant context
         """
-        # Sentiment keywords to prioritize
-        sentiment_keywords = {
-            'positive': ['surge', 'gain', 'up', 'rise', 'beat', 'exceed', 'strong', 
-                        'growth', 'profit', 'success', 'bullish', 'rally'],
-            'negative': ['fall', 'drop', 'down', 'loss', 'miss', 'weak', 'decline',
-                        'bearish', 'crash', 'plunge', 'slump', 'concern']
-        }
-        
         all_contexts = self.extract_context_for_ticker(text, ticker)
         
         if not all_contexts:
             return ""
         
-        # Score each context by sentiment word presence
+        # Score each context by how many sentiment words it contains
         scored_contexts = []
         for context in all_contexts:
-            context_lower = context.lower()
-            score = 0
-            
-            for sentiment_list in sentiment_keywords.values():
-                for word in sentiment_list:
-                    if word in context_lower:
-                        score += 1
-            
+            score = len(set(self.SENTIMENT_PATTERN.findall(context.lower())))
             scored_contexts.append((score, context))
         
-        # Return highest scoring context
-        scored_contexts.sort(reverse=True, key=lambda x: x[0])
-        return scored_contexts[0][1] if scored_contexts else all_contexts[0]
+        # Return highest scoring context (first one wins ties)
+        return max(scored_contexts, key=lambda x: x[0])[1]
+
+
+@lru_cache(maxsize=1)
+def get_default_extractor(context_window=10):
+    """
+    Get the shared extractor used by analyze_article_contexts.
+    
+    Built on first use, so the ticker database is loaded once per
+    process instead of once per article.
+    """
+    return ContextExtractor(context_window=context_window)
 
 
-def analyze_article_contexts(article, tickers):
+def analyze_article_contexts(article, tickers, extractor=None):
     """
     Analyze an article and extract contexts for all tickers.
     
     Args:
         article (dict): Article dictionary
         tickers (list): List of tickers to analyze
+        extractor (ContextExtractor): Extractor to use (default: shared 10-word extractor)
     
     Returns:
         dict: Article with added context information
     """
-    extractor = ContextExtractor(context_window=10)
+    if extractor is None:
+        extractor = get_default_extractor()
     
     # Combine text
     full_text = f"{article.get('title', '')} {article.get('description', '')} {article.get('body', '')}"
@@ -0,0 +1,79 @@
+# utils/json_io.py
+"""
+Fast JSON reading and writing for the exports and scraper outputs.
+Uses orjson when it is installed, standard json otherwise.
+"""
+
+import json
+
+try:
+    import orjson  # Optional: Rust JSON encoder, much faster than json.dump
+except ImportError:
+    orjson = None
+
+
+def write_json(data, filepath):
+    """
+    Write data to a UTF-8 JSON file with 2-space indentation.
+    
+    Args:
+        data: JSON-serializable data
+        filepath (str): Output file path
+    """
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def loads(data):
+    """
+    Parse a JSON document (e.g. an API response body).
+    
+    Args:
+        data (bytes or str): Raw JSON
+    
+    Returns:
+        Parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(value):
+    """Serialize one value to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+
+def write_json_stream(filepath, records, key='articles', **fields):
+    """
+    Write {**fields, key: [records]} to a JSON file one record at a time.
+    
+    Unlike write_json, the whole document is never built in memory, so this
+    is used for the large article exports. Each record goes on its own line.
+    
+    Args:
+        filepath (str): Output file path
+        records (iterable): Records to write (can be a generator)
+        key (str): Name of the records list in the output
+        **fields: Extra top-level fields written before the records
+    """
+    with open(filepath, 'wb') as f:
+        f.write(b'{')
+        for name, value in fields.items():
+            f.write(_dumps(name) + b': ' + _dumps(value) + b', ')
+        f.write(_dumps(key) + b': [')
+        
+        separator = b'\n'
+        for record in records:
+            f.write(separator)
+            f.write(_dumps(record))
+            separator = b',\n'
+        
+        f.write(b'\n]}\n')
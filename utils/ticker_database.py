@@ -0,0 +1,134 @@
+# utils/ticker_database.py
+"""
+Runtime access to the ticker database.
+
+ticker_database.json is built once by ticker_database_manual.py
+(python utils/ticker_database_manual.py) and committed with the code.
+At runtime we only read that file - the ticker list is never rebuilt.
+Nothing is read at import time; the file is parsed on the first lookup.
+"""
+
+import logging
+import os
+import sys
+import threading
+from functools import lru_cache
+
+from utils.json_io import loads
+
+logger = logging.getLogger(__name__)
+
+DATABASE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ticker_database.json')
+
+# Makes a caller that arrives during the warm-up wait for it instead of
+# parsing the file a second time
+database_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def load_database_file():
+    """
+    Read and parse ticker_database.json (once per process).
+    
+    Returns:
+        dict: The whole database document, shared by all callers
+    """
+    with open(DATABASE_FILE, 'rb') as f:
+        return loads(f.read())
+
+
+@lru_cache(maxsize=1)
+def build_ticker_maps():
+    """
+    Build the interned ticker maps from the database file (once per process).
+    
+    Only call this through load_ticker_database, which holds database_lock,
+    so two threads arriving together can't each build their own copy.
+    
+    Returns:
+        tuple: (ticker_to_company, company_to_ticker) dicts
+    
+    Raises:
+        OSError, ValueError: If the file can't be read or parsed (not
+            cached, so the next call tries again)
+    """
+    data = load_database_file()
+    
+    # Intern the ticker symbols so both maps share one string per ticker
+    # and equality checks between them short-circuit on identity
+    ticker_to_company = {
+        sys.intern(ticker): company
+        for ticker, company in data.get('ticker_to_company', {}).items()
+    }
+    company_to_ticker = {
+        company: sys.intern(ticker)
+        for company, ticker in data.get('company_to_ticker', {}).items()
+    }
+    
+    return ticker_to_company, company_to_ticker
+
+
+def load_ticker_database():
+    """
+    Load the prebuilt ticker database (parsed once per process).
+    
+    Returns:
+        tuple: (ticker_to_company, company_to_ticker) dicts, shared by all
+        callers - treat them as read-only
+    """
+    # The whole build runs under the lock, so a caller that arrives during
+    # the warm-up waits for it and then gets the very same dicts
+    with database_lock:
+        try:
+            return build_ticker_maps()
+        except (OSError, ValueError):
+            # Not cached - a later call retries, so a failed warm-up
+            # doesn't leave the process without tickers for good
+            logger.warning("⚠️  Warning: Could not load ticker database from %s", DATABASE_FILE)
+            return {}, {}
+
+
+def warm_up_ticker_database():
+    """
+    Start loading the database on a background thread.
+    
+    Call this early in an entry point, before other slow setup; the
+    extractors created afterwards then find the database already loaded.
+    
+    Returns:
+        threading.Thread: The started daemon thread
+    """
+    thread = threading.Thread(target=load_ticker_database, daemon=True, name='ticker-db-warmup')
+    thread.start()
+    return thread
+
+
+def get_ticker_to_company():
+    """
+    Get the ticker -> company name map (loaded on first call).
+    
+    Returns:
+        dict: e.g. {'AAPL': 'Apple Inc.', ...}
+    """
+    return load_ticker_database()[0]
+
+
+def get_company_to_ticker():
+    """
+    Get the lowercase company name -> ticker map (loaded on first call).
+    
+    Returns:
+        dict: e.g. {'apple inc.': 'AAPL', 'apple': 'AAPL', ...}
+    """
+    return load_ticker_database()[1]
+
+
+def create_ambiguous_words_list():
+    """
+    Company names that are also everyday words.
+    These need financial context nearby before they count as a mention.
+    
+    Returns:
+        set: Lowercase ambiguous words (a new set each call)
+    """
+    return {'target', 'general', 'apple', 'amazon', 'meta', 'oracle', 'gap', 'best'}
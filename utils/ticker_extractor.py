@@ -4,9 +4,11 @@ Smart ticker extraction from news articles.
 Detects both $TICKER format and company names in text.
 """
 
+import logging
 import re
 import os
 import sys
+from functools import lru_cache
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -17,11 +19,11 @@ except ImportError:
     # Fallback if ticker_database doesn't exist
     print("⚠️  Warning: Using fallback ticker database loading")
     def load_ticker_database():
-        import json
+        from utils.json_io import loads  # orjson when installed
         filepath = os.path.join(os.path.dirname(__file__), 'ticker_database.json')
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = loads(f.read())
             return data.get('ticker_to_company', {}), data.get('company_to_ticker', {})
         except:
             return {}, {}
@@ -29,17 +31,61 @@ except ImportError:
     def create_ambiguous_words_list():
         return {'target', 'general', 'apple', 'amazon', 'meta', 'oracle', 'gap', 'best'}
 
+logger = logging.getLogger(__name__)
+
+# $ followed by 1-5 uppercase letters (e.g. $AAPL)
+DOLLAR_TICKER_PATTERN = re.compile(r'\$([A-Z]{1,5})\b')
+
+# Runs of word characters, as regex \b sees them
+WORD_PATTERN = re.compile(r'\w+')
+
+try:
+    import ahocorasick  # Optional: pyahocorasick finds every company name in one pass
+except ImportError:
+    ahocorasick = None
+
+
+def is_word_char(char):
+    """Same as regex \\w: letters, digits and underscore."""
+    return char.isalnum() or char == '_'
+
+
+def is_word_boundary(text, pos):
+    """
+    Check for a word boundary at text[pos], same as regex \\b.
+    
+    Args:
+        text (str): Text to check
+        pos (int): Position between text[pos - 1] and text[pos]
+    
+    Returns:
+        bool: True if exactly one side of pos is a word character
+    """
+    before = pos > 0 and is_word_char(text[pos - 1])
+    after = pos < len(text) and is_word_char(text[pos])
+    return before != after
+
 
 class TickerExtractor:
     """Extract stock tickers from news article text."""
     
-    def __init__(self):
-        """Initialize the ticker extractor with database."""
-        print("🔧 Initializing Ticker Extractor...")
+    def __init__(self, verbose=True):
+        """
+        Initialize the ticker extractor with database.
+        
+        Args:
+            verbose (bool): Log loading progress (DEBUG level, so it only
+                shows when debug logging is turned on)
+        """
+        if verbose:
+            logger.debug("🔧 Initializing Ticker Extractor...")
         
         # Load ticker database
         self.ticker_to_company, self.company_to_ticker = load_ticker_database()
         
+        # Tickers a $TICKER match has to be one of
+        self.valid_tickers = frozenset(self.ticker_to_company)
+        
         # Load ambiguous words
         self.ambiguous_words = create_ambiguous_words_list()
         
@@ -53,8 +99,49 @@ class TickerExtractor:
             'wall street', 'analyst', 'buy', 'sell', 'ticker', 'symbol'
         }
         
-        print(f"✓ Loaded {len(self.ticker_to_company)} tickers")
-        print(f"✓ Loaded {len(self.company_to_ticker)} company name mappings")
+        # All context words in one pattern, so a context window is scanned once
+        self.financial_context_pattern = re.compile('|'.join(
+            re.escape(word) for word in sorted(self.financial_context, key=len, reverse=True)
+        ))
+        
+        # One automaton over every company name (4+ chars), built once.
+        # Values keep each name's position in company_to_ticker so matches
+        # come back in the same order as the per-name loop.
+        self.company_automaton = None
+        if ahocorasick is not None:
+            self.company_automaton = ahocorasick.Automaton()
+            for order, (company_name, ticker) in enumerate(self.company_to_ticker.items()):
+                if len(company_name) >= 4:
+                    self.company_automaton.add_word(company_name, (order, company_name, ticker))
+            if len(self.company_automaton) > 0:
+                self.company_automaton.make_automaton()
+            else:
+                self.company_automaton = None
+        
+        # Shortest name either matcher looks for - shorter texts can't contain one
+        self.min_company_name_len = min(
+            (len(company_name) for company_name in self.company_to_ticker if len(company_name) >= 4),
+            default=4
+        )
+        
+        # Whole-word patterns for the per-name fallback, compiled on first use
+        self.company_patterns = {}
+        
+        # Fallback index: leading word of each company name -> names.
+        # A whole-word match always starts with that same word in the text,
+        # so only names whose leading word is in the article need checking.
+        # Names that start with punctuation go under '' and are always checked.
+        self.company_name_index = {}
+        if self.company_automaton is None:
+            for order, (company_name, ticker) in enumerate(self.company_to_ticker.items()):
+                if len(company_name) >= 4:
+                    leading_word = WORD_PATTERN.match(company_name)
+                    key = leading_word.group() if leading_word else ''
+                    self.company_name_index.setdefault(key, []).append((order, company_name, ticker))
+        
+        if verbose:
+            logger.debug("✓ Loaded %d tickers", len(self.ticker_to_company))
+            logger.debug("✓ Loaded %d company name mappings", len(self.company_to_ticker))
     
     def extract_dollar_tickers(self, text):
         """
@@ -67,12 +154,12 @@ class TickerExtractor:
             list: List of tickers found
         """
         # Pattern: $ followed by 1-5 uppercase letters
-        pattern = r'\$([A-Z]{1,5})\b'
-        
-        matches = re.findall(pattern, text)
+        matches = DOLLAR_TICKER_PATTERN.findall(text)
         
-        # Filter to only valid tickers in our database
-        valid_tickers = [t for t in matches if t in self.ticker_to_company]
+        # Filter to only valid tickers in our database. Interning swaps each
+        # match for the database's own ticker string, so result dicts share
+        # one key object per ticker with the company name matches.
+        valid_tickers = [sys.intern(t) for t in matches if t in self.valid_tickers]
         
         return valid_tickers
     
@@ -90,57 +177,125 @@ class TickerExtractor:
         text_lower = text.lower()
         found_tickers = []
         
-        # Search for each company name in our database
-        for company_name, ticker in self.company_to_ticker.items():
-            # Skip very short names (too many false positives)
-            if len(company_name) < 4:
+        for company_name, ticker, start, is_ambiguous in self._find_company_names(text_lower):
+            if is_ambiguous and require_context:
+                # For ambiguous words, require financial context nearby
+                if self._has_financial_context(text_lower, start, start + len(company_name)):
+                    found_tickers.append(ticker)
+            else:
+                # Not ambiguous, add it
+                found_tickers.append(ticker)
+        
+        return found_tickers
+    
+    def _find_company_names(self, text_lower):
+        """
+        Find every company name in the text (one scan).
+        
+        Args:
+            text_lower (str): Lowercase article text
+        
+        Returns:
+            list: (company_name, ticker, start, is_ambiguous) tuples in
+                  company_to_ticker order, start being where the name's
+                  first whole-word match begins
+        """
+        # Short headlines and tweets can't hold any company name
+        if len(text_lower) < self.min_company_name_len:
+            return []
+        
+        if self.company_automaton is not None:
+            matched_names = self._match_company_names(text_lower)
+        else:
+            matched_names = self._scan_company_names(text_lower)
+        
+        # Handle ambiguous words (first word of company is a common word)
+        return [
+            (company_name, ticker, start, company_name.split()[0] in self.ambiguous_words)
+            for company_name, ticker, start in matched_names
+        ]
+    
+    def _match_company_names(self, text_lower):
+        """
+        Find company names that appear as whole words, in one automaton pass.
+        
+        Args:
+            text_lower (str): Lowercase article text
+        
+        Returns:
+            list: (company_name, ticker, start) tuples in company_to_ticker order
+        """
+        matched = {}
+        
+        for end_index, (order, company_name, ticker) in self.company_automaton.iter(text_lower):
+            if order in matched:
                 continue
             
+            # "target" should match as a word, not in "targets"
+            start = end_index - len(company_name) + 1
+            if is_word_boundary(text_lower, start) and is_word_boundary(text_lower, end_index + 1):
+                matched[order] = (company_name, ticker, start)
+        
+        return [matched[order] for order in sorted(matched)]
+    
+    def _scan_company_names(self, text_lower):
+        """
+        Find company names that appear as whole words, checking one candidate
+        name at a time. Used when pyahocorasick isn't installed.
+        
+        Args:
+            text_lower (str): Lowercase article text
+        
+        Returns:
+            list: (company_name, ticker, start) tuples in company_to_ticker order
+        """
+        matched_names = []
+        
+        # Only names whose leading word appears in the text can match
+        # (names under 4 chars are left out of the index - too many false positives)
+        words = set(WORD_PATTERN.findall(text_lower))
+        words.add('')
+        candidates = sorted(
+            candidate
+            for word in words
+            for candidate in self.company_name_index.get(word, ())
+        )
+        
+        for order, company_name, ticker in candidates:
             # Check if company name appears in text
             if company_name in text_lower:
-                # Handle ambiguous words
-                simple_name = company_name.split()[0]  # First word of company
-                
                 # IMPROVED: Check word boundaries to avoid partial matches
                 # "target" should match as a word, not in "targets"
-                import re
-                pattern = r'\b' + re.escape(company_name) + r'\b'
-                if not re.search(pattern, text_lower):
+                pattern = self.company_patterns.get(company_name)
+                if pattern is None:
+                    pattern = re.compile(r'\b' + re.escape(company_name) + r'\b')
+                    self.company_patterns[company_name] = pattern
+                match = pattern.search(text_lower)
+                if match is None:
                     continue  # Not a complete word match, skip it
                 
-                if simple_name in self.ambiguous_words and require_context:
-                    # For ambiguous words, require financial context nearby
-                    if self._has_financial_context(text_lower, company_name):
-                        found_tickers.append(ticker)
-                else:
-                    # Not ambiguous, add it
-                    found_tickers.append(ticker)
+                matched_names.append((company_name, ticker, match.start()))
         
-        return found_tickers
+        return matched_names
     
-    def _has_financial_context(self, text, company_name):
+    def _has_financial_context(self, text, start, end):
         """
         Check if company mention has financial context nearby.
         
         Args:
             text (str): Full text (lowercase)
-            company_name (str): Company name to check around
+            start (int): Where the company name match begins
+            end (int): Where the company name match ends
         
         Returns:
             bool: True if financial context found nearby
         """
-        # Find position of company name
-        pos = text.find(company_name)
-        if pos == -1:
-            return False
-        
-        # Extract 100 characters before and after
-        start = max(0, pos - 100)
-        end = min(len(text), pos + len(company_name) + 100)
-        context = text[start:end]
+        # Extract 100 characters before and after (the matchers already
+        # know where the name is, so no need to search for it again)
+        context = text[max(0, start - 100):min(len(text), end + 100)]
         
         # Check if any financial words appear in context
-        return any(word in context for word in self.financial_context)
+        return self.financial_context_pattern.search(context) is not None
     
     def extract_all_tickers(self, text):
         """
@@ -159,7 +314,7 @@ class TickerExtractor:
         company_tickers = self.extract_company_names(text, require_context=True)
         
         # Combine and remove duplicates
-        all_tickers = list(set(dollar_tickers + company_tickers))
+        all_tickers = list(set(dollar_tickers).union(company_tickers))
         
         return all_tickers
     
@@ -180,20 +335,35 @@ class TickerExtractor:
         for ticker in dollar_tickers:
             ticker_confidence[ticker] = 100
         
+        # Scan for company names once and score from the same matches
+        text_lower = text.lower()
+        company_matches = self._find_company_names(text_lower)
+        
         # Company name = 80% confidence (could be false positive)
-        company_tickers = self.extract_company_names(text, require_context=True)
-        for ticker in company_tickers:
+        for company_name, ticker, start, is_ambiguous in company_matches:
             if ticker not in ticker_confidence:
-                ticker_confidence[ticker] = 80
+                if not is_ambiguous or self._has_financial_context(text_lower, start, start + len(company_name)):
+                    ticker_confidence[ticker] = 80
         
         # Company name without context = 50% confidence
-        company_tickers_no_context = self.extract_company_names(text, require_context=False)
-        for ticker in company_tickers_no_context:
+        for company_name, ticker, start, is_ambiguous in company_matches:
             if ticker not in ticker_confidence:
                 ticker_confidence[ticker] = 50
         
         return ticker_confidence
     
+    def extract_with_confidence_batch(self, texts):
+        """
+        Extract tickers with confidence scores for many texts.
+        
+        Args:
+            texts (list): Article texts
+        
+        Returns:
+            list: One {ticker: confidence_score} dict per text
+        """
+        return [self.extract_with_confidence(text) for text in texts]
+    
     def get_ticker_info(self, ticker):
         """
         Get company information for a ticker.
@@ -213,6 +383,17 @@ class TickerExtractor:
         }
 
 
+@lru_cache(maxsize=1)
+def get_default_extractor():
+    """
+    Get the shared extractor used by extract_tickers_from_article.
+    
+    Built on first use, so the database is loaded and the company name
+    matcher is built once per process instead of once per article.
+    """
+    return TickerExtractor()
+
+
 def extract_tickers_from_article(article):
     """
     Extract tickers from a standardized article dictionary.
@@ -223,7 +404,7 @@ def extract_tickers_from_article(article):
     Returns:
         dict: Article with added 'tickers_mentioned' field
     """
-    extractor = TickerExtractor()
+    extractor = get_default_extractor()
     
     # Combine all text fields
     text_parts = [
@@ -243,6 +424,19 @@ def extract_tickers_from_article(article):
     return article
 
 
+def extract_tickers_from_articles(articles):
+    """
+    Extract tickers from many standardized article dictionaries.
+    
+    Args:
+        articles (list): Articles with 'title', 'description', 'body' fields
+    
+    Returns:
+        list: The same articles with added 'tickers_mentioned' field
+    """
+    return [extract_tickers_from_article(article) for article in articles]
+
+
 def test_ticker_extraction():
     """Test ticker extraction with sample headlines."""
     